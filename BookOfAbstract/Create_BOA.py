@@ -1,12 +1,26 @@
 #%% Libraries
 
 import re
+import sys
 import requests
 import openpyxl
 from pathlib import Path
 from urllib.parse import urlparse
 import numpy as np
 import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import time
+import io
+import gzip
+import json
+import hashlib
+from array import array
+from bisect import bisect_left, bisect_right, insort
 
 
 #%% Variables
@@ -19,12 +33,19 @@ XLSX_PATH 			= Path(r"Z:\ikkv\Dokus_LKKV\040_Projekte\02_Eigenforschung\2025-09-
 # Path where to store the .tex file
 OUT_TEX   			= Path(r"Z:\ikkv\Dokus_LKKV\040_Projekte\02_Eigenforschung\2025-09-Thomas\Book-of-Abstracts/BookAbstract.tex")
 
+# Path where to store the downloaded pdfs
+PDF_DIR 			= Path(r"Z:\ikkv\Dokus_LKKV\040_Projekte\02_Eigenforschung\2025-09-Thomas\Book-of-Abstracts\downloaded_pdfs")
+
 # If no PDF is found following the URL, look for the PDF in the following folder
 LOCAL_FALLBACK_DIR = Path(r"C:\Users\p2515497\Documents\WIEN_CONF_2025\LOCAL_PDFS")
 
 
 USE_URL_CELL_AS_LOCAL_FILENAME = True
 
+# Local snapshot of the rows read from the excel file, so that an unchanged excel file is not parsed again.
+# None to always read the excel file
+SNAPSHOT_PATH 		= Path(r"C:\Users\p2515497\Documents\WIEN_CONF_2025\Abstract_list.snapshot.json.gz")
+
 
 #%%% Excel variables
 SHEET_NAME 		= None		  # e.g. "Sheet1" or None for active sheet
@@ -35,6 +56,9 @@ AREA_COL 		= 9
 TITLE_COL 		= 2
 AUTHOR_COL 		= 10
 TIMEOUT 		= 60
+DOWNLOAD_CHUNK_SIZE = 1024 * 128	# bytes read at once when downloading a pdf
+MAX_PDF_SIZE 	= 50 * 1024 * 1024	# larger downloads are aborted, None for no limit
+WORKERS 		= 8					# pdfs downloaded in parallel
 
 AREA_ORDER  	= ["Plenary","Damage Mechanics","Optimization & Dynamic Response", "Delamination & Impact", "Novel Approaches", "Fracture Mechanics","Thin Ply", "Buckling / Stability","Structures","Multi-scale modeling","Novel Materials","Machine Learning I","Machine Learning II"]
 
@@ -57,6 +81,15 @@ _LATEX_SPECIALS = {
 		"^": r"\textasciicircum{}",
 }
 
+PDF_MAGIC 		= b"%PDF-"
+
+#%%% Library API variables
+
+LATEX_COMPILER 	= "lualatex"
+LATEX_RUNS 		= 2					# \pageref needs the .aux file written by the previous run
+BUILD_CACHE_SIZE = 32				# number of workbooks and books (.tex) kept in memory
+BUILD_CACHE_PDF_BYTES = 512 * 1024 * 1024	# total size of the compiled pdfs kept in memory
+
 # -----------------------------------------------------------------------
 
 
@@ -146,6 +179,201 @@ def parse_all_authors(authors_cell: str) -> list[str]:
 	return clean
 
 
+#%% Excel snapshot
+
+def read_workbook_rows(source) -> list[dict]:
+	"""
+	Read the rows of the excel file with openpyxl.
+
+	Parameters
+	----------
+	source : Path or file-like object
+		excel file to read.
+
+	Returns
+	-------
+	list[dict]
+		One dict per non-empty row, with the keys row, area, title, authors (raw cell text), url and url_text.
+
+	"""
+	wb = openpyxl.load_workbook(source, data_only=True)
+	ws = wb[SHEET_NAME] if SHEET_NAME else wb.active
+
+	rows = []
+	for row in range(START_ROW, ws.max_row + 1):
+		url_cell = ws.cell(row=row, column=URL_COL)
+		r = {
+			"row": row,
+			"area": get_cell_text(ws.cell(row=row, column=AREA_COL)),
+			"title": get_cell_text(ws.cell(row=row, column=TITLE_COL)),
+			"authors": get_cell_text(ws.cell(row=row, column=AUTHOR_COL)),
+			"url": get_cell_url(url_cell),
+			"url_text": get_cell_text(url_cell),
+		}
+		if any(r[k] for k in ("area", "title", "authors", "url", "url_text")):
+			rows.append(r)
+	return rows
+
+
+def _snapshot_settings() -> list:
+	# the snapshot is only valid for the excel layout it has been read with
+	return [SHEET_NAME, START_ROW, URL_COL, AREA_COL, TITLE_COL, AUTHOR_COL]
+
+
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+def snapshot_path_for(xlsx_path: Path, snapshot_path: Path | None = SNAPSHOT_PATH) -> Path | None:
+	"""
+	Return the snapshot file of the excel file: snapshot_path for XLSX_PATH, None (no snapshot) for any other excel
+	file, e.g. the uploads given to build_book(), whose rows are already kept in memory between builds. This way a
+	single snapshot file is ever written, and the snapshots of different excel files never overwrite each other.
+	"""
+	if snapshot_path is None or xlsx_path.resolve() != Path(XLSX_PATH).resolve():
+		return None
+	return snapshot_path
+
+
+def load_snapshot(snapshot_path: Path, xlsx_path: Path) -> dict | None:
+	"""
+	Return the snapshot stored at snapshot_path, or None if there is none, it cannot be read, or it has been read from
+	another excel file or with another excel layout.
+	"""
+	try:
+		with gzip.open(snapshot_path, "rt", encoding="utf-8") as f:
+			snapshot = json.load(f)
+	except Exception:
+		return None
+	if snapshot.get("settings") != _snapshot_settings() or snapshot.get("xlsx_path") != str(xlsx_path.resolve()):
+		return None
+	return snapshot
+
+
+def save_snapshot(snapshot_path: Path, snapshot: dict) -> None:
+	"""
+	Write the snapshot to snapshot_path. The snapshot is written to a temporary file of its own, which then replaces
+	snapshot_path at once, so an interrupted run or another run writing at the same time cannot corrupt it.
+	"""
+	with _SNAPSHOT_LOCK:
+		_write_snapshot(snapshot_path, snapshot)
+
+
+def _write_snapshot(snapshot_path: Path, snapshot: dict) -> None:
+	snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+	with tempfile.NamedTemporaryFile(dir=snapshot_path.parent, prefix=snapshot_path.name + ".", suffix=".tmp",
+								  delete=False) as tmp:
+		tmp_path = Path(tmp.name)
+		try:
+			with gzip.open(tmp, "wt", encoding="utf-8") as f:
+				json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+		except BaseException:
+			tmp.close()
+			tmp_path.unlink(missing_ok=True)
+			raise
+	tmp_path.replace(snapshot_path)
+
+
+def diff_workbook_rows(old_rows: list[dict], new_rows: list[dict]) -> dict[str, list[int]]:
+	"""
+	Compare two lists of rows. Rows are matched by title and URL (or url_text), so that inserting or deleting a row
+	does not mark all the rows below it as changed; rows left unmatched are then matched by their excel row number.
+	A row moved to another row number without any other change is not reported.
+
+	Returns
+	-------
+	dict[str, list[int]]
+		Row numbers of the "added" and "changed" rows (in the new rows) and of the "removed" rows (in the old rows).
+
+	"""
+	def key(r: dict) -> tuple:
+		return (r["title"], r["url"] or r["url_text"])
+
+	def content(r: dict) -> dict:
+		return {k: v for k, v in r.items() if k != "row"}
+
+	old_by_key: dict[tuple, list[dict]] = {}
+	for r in old_rows:
+		old_by_key.setdefault(key(r), []).append(r)
+
+	pairs = []
+	unmatched_new = []
+	for r in new_rows:
+		same_key = old_by_key.get(key(r))
+		if same_key:
+			pairs.append((same_key.pop(0), r))
+		else:
+			unmatched_new.append(r)
+
+	# fallback: match the remaining rows by row number
+	unmatched_old = {r["row"]: r for rs in old_by_key.values() for r in rs}
+	added = []
+	for r in unmatched_new:
+		if r["row"] in unmatched_old:
+			pairs.append((unmatched_old.pop(r["row"]), r))
+		else:
+			added.append(r["row"])
+
+	return {
+		"added": sorted(added),
+		"removed": sorted(unmatched_old),
+		"changed": sorted(new["row"] for old, new in pairs if content(old) != content(new)),
+	}
+
+
+def print_rows_diff(diff: dict[str, list[int]], new_rows: list[dict]) -> None:
+	titles = {r["row"]: r["title"] for r in new_rows}
+	if not any(diff.values()):
+		print("Excel file changed, but none of the rows read did")
+		return
+	print(f"Excel file changed: {len(diff['added'])} row(s) added, {len(diff['removed'])} removed, {len(diff['changed'])} changed")
+	for row in diff["added"]:
+		print(f"  + row {row} | title={titles[row]}")
+	for row in diff["removed"]:
+		print(f"  - row {row}")
+	for row in diff["changed"]:
+		print(f"  ~ row {row} | title={titles[row]}")
+
+
+def load_workbook_rows(xlsx_path: Path, snapshot_path: Path | None = SNAPSHOT_PATH) -> list[dict]:
+	"""
+	Return the rows of the excel file (see read_workbook_rows), using its local snapshot (see snapshot_path_for)
+	whenever possible.
+	- same size and modification time as the snapshot: the rows of the snapshot are returned, the excel file is not read
+	- otherwise the excel file is read once and hashed; same hash: the rows of the snapshot are returned
+	- otherwise the excel file is parsed, the differences with the snapshot are printed and the snapshot is updated
+	"""
+	snapshot_path = snapshot_path_for(xlsx_path, snapshot_path)
+	if snapshot_path is None:
+		return read_workbook_rows(xlsx_path)
+
+	st = xlsx_path.stat()
+	snapshot = load_snapshot(snapshot_path, xlsx_path)
+	if snapshot is not None and snapshot["size"] == st.st_size and snapshot["mtime_ns"] == st.st_mtime_ns:
+		print(f"Excel file unchanged, rows read from the snapshot: {snapshot_path}")
+		return snapshot["rows"]
+
+	data = xlsx_path.read_bytes()
+	sha256 = hashlib.sha256(data).hexdigest()
+	if snapshot is not None and snapshot["sha256"] == sha256:
+		print(f"Excel file touched but unchanged, rows read from the snapshot: {snapshot_path}")
+		rows = snapshot["rows"]
+	else:
+		rows = read_workbook_rows(io.BytesIO(data))
+		if snapshot is not None:
+			print_rows_diff(diff_workbook_rows(snapshot["rows"], rows), rows)
+
+	save_snapshot(snapshot_path, {
+		"settings": _snapshot_settings(),
+		"xlsx_path": str(xlsx_path.resolve()),
+		"size": st.st_size,
+		"mtime_ns": st.st_mtime_ns,
+		"sha256": sha256,
+		"rows": rows,
+	})
+	return rows
+
+
+
 #%% File helper functions 
 
 def find_local_pdf(rec: dict, idx: int, url_cell_text: str = "") -> Path | None:
@@ -196,24 +424,30 @@ def find_local_pdf(rec: dict, idx: int, url_cell_text: str = "") -> Path | None:
 
 
 
-def filename_from_url(url: str, idx: int) -> str:
+def filename_from_url(url: str) -> str:
+	"""
+	Return the local filename of the pdf downloaded from url: the name of the file in the url, followed by a hash of
+	the whole url, so that different urls (e.g. ".../download.php?id=17" and "...?id=99") never share a file, whatever
+	book or position in the book they are used for.
+	"""
 	parsed = urlparse(url)
 	name = Path(parsed.path).name
 	if not name.lower().endswith(".pdf") or not name:
 		name = "file.pdf"
 	stem = Path(name).stem
-	return sanitize_filename(f"{stem}_{idx:04d}.pdf")
+	digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:12]
+	return f"{sanitize_filename(stem, max_len=60)}_{digest}.pdf"
 
 
 def filename_for_record(rec: dict, idx: int) -> str:
 	"""
 	Return a stable local filename for this record.
-	- If URL exists: derive from URL (original behavior)
+	- If URL exists: derive from URL (see filename_from_url)
 	- Else: derive from local filename in url_text (if present), else from title, else fallback on idx.
 	"""
 	url = rec.get("url")
 	if url:
-		return filename_from_url(url, idx)
+		return filename_from_url(url)
 
 	# no URL -> try local filename from the URL cell text
 	url_text = (rec.get("url_text") or "").strip()
@@ -255,13 +489,18 @@ def is_pdf_file(path: Path) -> bool:
 	# 
 	try:
 		with open(path, "rb") as f:
-			return f.read(5) == b"%PDF-"
+			return f.read(len(PDF_MAGIC)) == PDF_MAGIC
 	except Exception:
 		return False
 
-def download_pdf(url: str, out_path: Path, timeout: int = TIMEOUT) -> None:
+def download_pdf(url: str, out_path: Path, timeout: int = TIMEOUT, chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+				max_size: int | None = MAX_PDF_SIZE) -> tuple[str, int]:
 	"""
-	
+	Download a pdf, chunk by chunk, checking it while it is streamed:
+	- the first bytes must be the pdf magic "%PDF-" (e.g. an HTML login page is rejected at the first chunk)
+	- the size must stay below max_size (checked against the Content-Length header first, then while streaming)
+	The content is written to a temporary file, which is renamed to out_path only once the whole pdf is downloaded,
+	so that a rejected or interrupted download never leaves a file at out_path.
 
 	Parameters
 	----------
@@ -271,28 +510,66 @@ def download_pdf(url: str, out_path: Path, timeout: int = TIMEOUT) -> None:
 		path where to store locally the pdf .
 	timeout : int, optional
 		waiting time before giving up. The default is TIMEOUT.
+	chunk_size : int, optional
+		size in bytes of the chunks read from the response. The default is DOWNLOAD_CHUNK_SIZE.
+	max_size : int | None, optional
+		maximum size in bytes of the pdf, None for no limit. The default is MAX_PDF_SIZE.
 
 	Returns
 	-------
-	None
-		DESCRIPTION.
+	tuple[str, int]
+		sha256 hash (hex) and size in bytes of the downloaded pdf.
 
 	"""
 	headers = {"User-Agent": "xlsx-pdf-embed/1.0"} 									#Extra care to make the request looks "normal" and is not blocked by the website (might be useless
 	with requests.get(url, headers=headers, stream=True, timeout=timeout) as r:
 		r.raise_for_status() 										# Raise an error if there is an error, instead of downloading the error message
+
+		content_length = r.headers.get("Content-Length")
+		if max_size is not None and content_length and content_length.isdigit() and int(content_length) > max_size:
+			raise ValueError(f"too large ({content_length} bytes > {max_size} bytes)")
+
+		sha256 = hashlib.sha256()
+		n_bytes = 0
+		head = b""													# first bytes, until there are enough to check the magic
 		out_path.parent.mkdir(parents=True, exist_ok=True) 			# Create the directory to store locally the pdf
-		with open(out_path, "wb") as f: 							# Download the pdf and store them in the right path
-			for chunk in r.iter_content(chunk_size=1024 * 128):
-				if chunk:
+		tmp_path = out_path.with_name(f"{out_path.name}.{threading.get_ident()}.part")	# one per thread, for parallel builds
+		try:
+			with open(tmp_path, "wb") as f: 						# Download the pdf and store them in the right path
+				for chunk in r.iter_content(chunk_size=chunk_size):
+					if not chunk:
+						continue
+					if len(head) < len(PDF_MAGIC):
+						head += chunk[:len(PDF_MAGIC) - len(head)]
+						if len(head) == len(PDF_MAGIC) and head != PDF_MAGIC:
+							raise ValueError(f"not a PDF (starts with {head!r}, Content-Type={r.headers.get('Content-Type', '')})")
+					n_bytes += len(chunk)
+					if max_size is not None and n_bytes > max_size:
+						raise ValueError(f"too large (more than {max_size} bytes)")
+					sha256.update(chunk)
 					f.write(chunk)
-	return
+			if head != PDF_MAGIC:
+				raise ValueError(f"not a PDF ({n_bytes} bytes only)")
+			tmp_path.replace(out_path)
+		except BaseException:
+			tmp_path.unlink(missing_ok=True)
+			raise
+	return sha256.hexdigest(), n_bytes
 
 
 
 
 
 def build_tex(records: list[dict], out_tex: Path) -> None:
+	out_tex.parent.mkdir(parents=True, exist_ok=True)
+	out_tex.write_text(make_tex(records), encoding="utf-8")
+	print(f"Wrote LaTeX file: {out_tex}")
+
+
+def make_tex(records: list[dict], scale: float = SCALE, area_order: list[str] = AREA_ORDER) -> str:
+	"""
+	Return the content of the .tex file of the book for the records (see collect_records).
+	"""
 	parts = []
 	parts.append(r"\documentclass[11pt]{article}")
 	parts.append(r"\usepackage[a4paper,margin=1.5cm]{geometry}")
@@ -334,7 +611,7 @@ def build_tex(records: list[dict], out_tex: Path) -> None:
 	parts.append(r"\includepdf[pages=1-4,scale=1,pagecommand={\thispagestyle{empty}}]{Book-of-Abstracts_Front-part.pdf}")
 	parts.append(r"\pagenumbering{arabic}")
 	parts.append(r"\setcounter{page}{1}")
-	parts.extend(make_custom_toc(records))
+	parts.extend(make_custom_toc(records, area_order))
 
 	current_area = None
 
@@ -351,7 +628,7 @@ def build_tex(records: list[dict], out_tex: Path) -> None:
 		parts.append(r"\gdef\CurrentPDFTarget{%s}" % rec["id"])
 		parts.append(r"\gdef\CurrentPDFLabel{%s}" % rec["label"])
 
-		if SCALE != 1.0:
+		if scale != 1.0:
 			parts.append(
 				r"\includepdf[pages=-,scale=%s,pagecommand={\thispagestyle{fancy}"
 				r"\ifx\CurrentPDFTarget\empty\else"
@@ -359,7 +636,7 @@ def build_tex(records: list[dict], out_tex: Path) -> None:
 				r"\hypertarget{\CurrentPDFTarget}{}"
 				r"\label{\CurrentPDFLabel}"
 				r"\gdef\CurrentPDFTarget{}\gdef\CurrentPDFLabel{}"
-				r"\fi}]{%s}" % (SCALE, latex_path)
+				r"\fi}]{%s}" % (scale, latex_path)
 			)
 		else:
 			parts.append(
@@ -378,17 +655,14 @@ def build_tex(records: list[dict], out_tex: Path) -> None:
 	
 	parts.append(r"\includepdf[pages=1,scale=1,pagecommand={\thispagestyle{empty}}]{Book-of-Abstracts_final-page.pdf}")
 	parts.append(r"\end{document}")
-
-	out_tex.parent.mkdir(parents=True, exist_ok=True)
-	out_tex.write_text("\n".join(parts), encoding="utf-8")
-	print(f"Wrote LaTeX file: {out_tex}")
+	return "\n".join(parts)
 
 
 
 
 
 
-def make_custom_toc(entries: list[dict]) -> list[str]:
+def make_custom_toc(entries: list[dict], area_order: list[str] = AREA_ORDER) -> list[str]:
 	"""
 	entries: list of dicts with keys:
 	- area
@@ -397,7 +671,7 @@ def make_custom_toc(entries: list[dict]) -> list[str]:
 	- main_author
 	- title
 
-	Produces a multi-page TOC grouped by AREA_ORDER.
+	Produces a multi-page TOC grouped by area_order (AREA_ORDER by default).
 	"""
 	parts = []
 	parts.append(r"\pagestyle{empty}")
@@ -422,13 +696,13 @@ def make_custom_toc(entries: list[dict]) -> list[str]:
 	parts.append(r"\endhead")
 
 	# Group entries by area (preserve order within each area)
-	by_area: dict[str, list[dict]] = {a: [] for a in AREA_ORDER}
+	by_area: dict[str, list[dict]] = {a: [] for a in area_order}
 	for e in entries:
 		a = e.get("area", "")
 		if a in by_area:
 			by_area[a].append(e)
 
-	for area in AREA_ORDER:
+	for area in area_order:
 		if not by_area[area]:
 			continue
 
@@ -455,7 +729,7 @@ def make_custom_toc(entries: list[dict]) -> list[str]:
 	parts.append(r"\pagestyle{fancy}")
 	return parts
 
-def make_author_index_section(author_index: dict[str, list[dict]]) -> list[str]:
+def make_author_index_section(author_index: "AuthorIndex") -> list[str]:
 	"""
 	Author Index in 2 columns.
 	Header printed at the top of BOTH columns on EACH page.
@@ -478,19 +752,18 @@ def make_author_index_section(author_index: dict[str, list[dict]]) -> list[str]:
 	parts.append(r"\vspace{0.5em}")
 
 	# ---- Build all rows first (as LaTeX lines) ----
-	authors_sorted = sorted(author_index.keys(), key=author_sort_key)
+	# authors are already kept sorted by the index, and the record indices of each author are kept in record order
 	row_lines: list[str] = []
 
-	for author in authors_sorted:
-		items = author_index.get(author, [])
-		items_sorted = sorted(items, key=lambda it: it.get("id", ""))
-
-		links = [r"\hyperlink{%s}{\pageref{%s}}" % (it["id"], it["label"]) for it in items_sorted]
+	for aid in author_index.sorted_author_ids():
+		links = [
+			r"\hyperlink{%s}{\pageref{%s}}" % (author_index.records[ri]["id"], author_index.records[ri]["label"])
+			for ri in author_index.postings[aid]
+		]
 		pages_tex = ", ".join(links) if links else ""
 
-		initials, surname = split_author_initials_surname(author)
-		initials_tex = latex_escape(initials)
-		surname_tex  = latex_escape(surname)
+		initials_tex = latex_escape(author_index.initials[aid])
+		surname_tex  = latex_escape(author_index.surnames[aid])
 
 		row_lines.append(
 			r"\parbox[t]{0.13\columnwidth}{\raggedleft %s} "
@@ -537,22 +810,14 @@ def make_author_index_section(author_index: dict[str, list[dict]]) -> list[str]:
 	return parts
 
 
-def build_author_index(records: list[dict]) -> dict[str, list[dict]]:
+def build_author_index(records: list[dict]) -> "AuthorIndex":
 	"""
-	Returns: { "Author Name": [ {id, label, title, area}, ... ], ... }
+	Returns an AuthorIndex holding, for every unique author, the indices of the records he/she contributed to.
 	"""
-	idx: dict[str, list[dict]] = {}
+	index = AuthorIndex()
 	for r in records:
-		for a in r.get("authors", []):
-			idx.setdefault(a, []).append({
-				"id": r["id"],
-				"label": r["label"],
-				"title": r["title"],
-				"area": r["area"],
-			})
-	# sort authors alphabetically (case-insensitive)
-	sorted_items = sorted(idx.items(), key=lambda kv: kv[0].casefold())
-	return dict(sorted(idx.items(), key=lambda kv: author_sort_key(kv[0])))
+		index.add_record(r)
+	return index
 
 
 def latex_escape(text: str) -> str:
@@ -588,8 +853,11 @@ def make_transition_page(area: str) -> list[str]:
 
 
 
-def author_sort_key(name: str) -> tuple[str, str]:
-	initials, surname = split_author_initials_surname(name)
+def author_sort_key(name: str, initials: str, surname: str) -> tuple[str, str, str]:
+	"""
+	Sort key of an author: surname, then initials, then full name (case-insensitive).
+	initials and surname are the parts of name returned by split_author_initials_surname.
+	"""
 	return (surname.casefold(), initials.casefold(), name.casefold())
 
 
@@ -621,100 +889,232 @@ def split_author_initials_surname(name: str) -> tuple[str, str]:
 	return (s[:i+1].strip(), s[i+1:].strip())
 
 
+class AuthorIndex:
+	"""
+	Inverted index from the authors to the records (abstracts) they contributed to.
+	Each unique author name is interned once to an integer ID, and its initials, surname and sort key are parsed at
+	that moment only. For every author ID, the index keeps a compact array of record indices, ordered by record id.
+	Records can be added or removed one at a time without rebuilding the index.
+	"""
 
+	def __init__(self) -> None:
+		self.author_ids: dict[str, int] = {}		# author name -> author ID
+		self.names: list[str] = []					# author ID -> author name
+		self.initials: list[str] = []
+		self.surnames: list[str] = []
+		self.sort_keys: list[tuple[str, str, str]] = []
+		self.postings: list[array] = []				# author ID -> array of record indices
+		self.records: list[dict | None] = []		# record index -> record, None once removed
+		self._record_authors: list[tuple[int, ...]] = []
+		self._sorted: list[tuple[tuple[str, str, str], str, int]] = []	# (sort key, name, author ID) of the authors having records
+
+	def __len__(self) -> int:
+		return len(self._sorted)
+
+	def __contains__(self, name: str) -> bool:
+		aid = self.author_ids.get(name)
+		return aid is not None and len(self.postings[aid]) > 0
+
+	def intern(self, name: str) -> int:
+		"""
+		Return the ID of the author, creating it (and parsing the name) the first time the name is seen.
+		"""
+		aid = self.author_ids.get(name)
+		if aid is None:
+			aid = len(self.names)
+			initials, surname = split_author_initials_surname(name)
+			self.author_ids[name] = aid
+			self.names.append(name)
+			self.initials.append(initials)
+			self.surnames.append(surname)
+			self.sort_keys.append(author_sort_key(name, initials, surname))
+			self.postings.append(array("I"))
+		return aid
+
+	def add_record(self, rec: dict) -> int:
+		"""
+		Add a record to the index and return its record index.
+		"""
+		ri = len(self.records)
+		aids = tuple(self.intern(a) for a in rec.get("authors", []))
+		self.records.append(rec)
+		self._record_authors.append(aids)
+		rec_id = rec.get("id", "")
+		for aid in aids:
+			postings = self.postings[aid]
+			if not postings:
+				insort(self._sorted, (self.sort_keys[aid], self.names[aid], aid))
+			if not postings or self.records[postings[-1]].get("id", "") <= rec_id:
+				postings.append(ri)
+			else:
+				# record re-added after later ones: keep the pages of the author ordered by record id
+				postings.insert(bisect_right(postings, rec_id, key=lambda i: self.records[i].get("id", "")), ri)
+		return ri
+
+	def remove_record(self, ri: int) -> dict:
+		"""
+		Remove the record with the record index ri from the index and return it.
+		Authors left without any record disappear from the author index.
+		"""
+		rec = self.records[ri]
+		if rec is None:
+			raise KeyError(f"Record {ri} has already been removed from the author index")
+		for aid in self._record_authors[ri]:
+			postings = self.postings[aid]
+			postings.remove(ri)
+			if not postings:
+				entry = (self.sort_keys[aid], self.names[aid], aid)
+				del self._sorted[bisect_left(self._sorted, entry)]
+		self.records[ri] = None
+		self._record_authors[ri] = ()
+		return rec
+
+	def sorted_author_ids(self) -> list[int]:
+		"""
+		Return the IDs of the authors having at least one record, sorted by surname, initials and name.
+		Names differing only by their case are ordered by their exact spelling, whatever the order they were added in.
+		"""
+		return [aid for _, _, aid in self._sorted]
+
+
+
+
+
+
+
+
+def is_transient_error(error: Exception) -> bool:
+	"""
+	Tell whether fetching a pdf again later might succeed: True for timeouts, connection errors and HTTP 5xx, 408 and
+	429; False for the pdfs rejected by download_pdf (not a pdf, too large) and the other HTTP 4xx (e.g. 404).
+	"""
+	if isinstance(error, ValueError):
+		return False
+	if isinstance(error, requests.HTTPError) and error.response is not None:
+		status = error.response.status_code
+		return status >= 500 or status in (408, 429)
+	return True
 
 
+def fetch_pdf(rec: dict, idx: int, pdf_dir: Path = PDF_DIR) -> tuple[Path | None, Exception | None]:
+	"""
+	Make sure the pdf of the record is available in pdf_dir (already there, downloaded, or copied from
+	LOCAL_FALLBACK_DIR).
+	Return (path of the pdf, None), (None, None) if the record has no pdf source, or (None, error) if fetching the pdf
+	failed (see is_transient_error to know whether trying again later might succeed).
+	"""
+	local_name = filename_for_record(rec, idx)
+	pdf_path = pdf_dir / local_name
 
+	try:
+		if not (pdf_path.exists() and is_pdf_file(pdf_path)):
+			if rec.get("url"):
+				# the pdf is checked while it is downloaded: no need to read it again
+				sha256, n_bytes = download_pdf(rec["url"], pdf_path)
+				src = f"URL, {n_bytes} bytes, sha256={sha256[:12]}"
+			else:
+				local_pdf = find_local_pdf(rec, idx, url_cell_text=rec.get("url_text", ""))
+				if local_pdf is None:
+					print(f"NO SOURCE (empty URL + not found locally) row {rec['row']} | title={rec['title']}")
+					return None, None
+				pdf_path.parent.mkdir(parents=True, exist_ok=True)
+				# copy then rename, so that a parallel build never sees a partly copied pdf (see download_pdf)
+				tmp_path = pdf_path.with_name(f"{pdf_path.name}.{threading.get_ident()}.part")
+				try:
+					shutil.copy2(local_pdf, tmp_path)
+					tmp_path.replace(pdf_path)
+				except BaseException:
+					tmp_path.unlink(missing_ok=True)
+					raise
+				src = "LOCAL"
+		else:
+			src = "CACHE"
 
+		print(f"OK ({src}) row {rec['row']} | area={rec['area']} | file={pdf_path.name}")
+		return pdf_path, None
 
-def main() -> None:
-	xlsx_path = Path(XLSX_PATH)
-	out_tex = Path(OUT_TEX)
+	except Exception as e:
+		print(f"ERROR row {rec['row']} area={rec['area']} url={rec.get('url','')} reason={e}")
+		return None, e
 
-	wb = openpyxl.load_workbook(xlsx_path, data_only=True)
-	ws = wb[SHEET_NAME] if SHEET_NAME else wb.active
 
-	pdf_dir = Path(r"Z:\ikkv\Dokus_LKKV\040_Projekte\02_Eigenforschung\2025-09-Thomas\Book-of-Abstracts\downloaded_pdfs")
-	per_area: dict[str, list[dict]] = {a: [] for a in AREA_ORDER}
+def collect_records(rows: list[dict], area_order: list[str] = AREA_ORDER, pdf_dir: Path = PDF_DIR,
+					executor: ThreadPoolExecutor | None = None, left_out: list[dict] | None = None) -> list[dict]:
+	"""
+	From the rows of the excel file (see read_workbook_rows), return the records of the book, ordered by area_order,
+	each with its local pdf_path, id and label. Rows whose pdf cannot be found are left out.
 
-	for row in range(START_ROW, ws.max_row + 1):
-		
-		url_cell = ws.cell(row=row, column=URL_COL)
-		url = get_cell_url(url_cell)
-		url_text = get_cell_text(url_cell)
+	Parameters
+	----------
+	rows : list[dict]
+		rows of the excel file.
+	area_order : list[str], optional
+		areas to include, in the order of the book. The default is AREA_ORDER.
+	pdf_dir : Path, optional
+		folder where the pdfs are stored. The default is PDF_DIR.
+	executor : ThreadPoolExecutor | None, optional
+		pool fetching the pdfs in parallel, None to fetch them one after the other. The default is None.
+	left_out : list[dict] | None, optional
+		if given, the rows left out of the book are appended to it, as dicts with the keys row, title, error (None
+		when the row has no pdf source, otherwise the exception raised while fetching its pdf) and transient (True
+		when fetching the pdf again later might succeed, see is_transient_error). The default is None.
 
-		area = get_cell_text(ws.cell(row=row, column=AREA_COL))
-		if area not in AREA_ORDER:
-			continue
+	Returns
+	-------
+	list[dict]
+		records of the book.
 
-		title = get_cell_text(ws.cell(row=row, column=TITLE_COL))
-		authors_cell = get_cell_text(ws.cell(row=row, column=AUTHOR_COL))
-		main_author = parse_main_author(authors_cell)
-		authors_list = parse_all_authors(authors_cell)
+	"""
+	per_area: dict[str, list[dict]] = {a: [] for a in area_order}
 
+	for r in rows:
+		area = r["area"]
+		if area not in per_area:
+			continue
 
 		per_area[area].append({
-			"row": row,
+			"row": r["row"],
 			"area": area,
-			"title": title if title else "(No title)",
-			"main_author": main_author,
-			"authors": authors_list,
-			"url": url,			  
-			"url_text": url_text,	
+			"title": r["title"] if r["title"] else "(No title)",
+			"main_author": parse_main_author(r["authors"]),
+			"authors": parse_all_authors(r["authors"]),
+			"url": r["url"],
+			"url_text": r["url_text"],
 			})
 
+	# the index of a record is its position in the book, whether its pdf is found or not
+	jobs = list(enumerate((rec for area in area_order for rec in per_area[area]), start=1))
+	if executor is None:
+		fetched = [fetch_pdf(rec, idx, pdf_dir) for idx, rec in jobs]
+	else:
+		fetched = list(executor.map(lambda job: fetch_pdf(job[1], job[0], pdf_dir), jobs))
 
 	records: list[dict] = []
-	idx = 0
-	
-	for area in AREA_ORDER:
-		for rec in per_area[area]:
-			idx += 1
-	
-			local_name = filename_for_record(rec, idx)
-			pdf_path = pdf_dir / local_name
-	
-			try:
-				if not (pdf_path.exists() and is_pdf_file(pdf_path)):
-					if rec.get("url"):
-						download_pdf(rec["url"], pdf_path)
-						src = "URL"
-					else:
-						local_pdf = find_local_pdf(rec, idx, url_cell_text=rec.get("url_text", ""))
-						if local_pdf is None:
-							print(f"NO SOURCE (empty URL + not found locally) row {rec['row']} | title={rec['title']}")
-							continue
-						pdf_path.parent.mkdir(parents=True, exist_ok=True)
-						shutil.copy2(local_pdf, pdf_path)
-						src = "LOCAL"
-				else:
-					src = "CACHE"
-	
-				if not is_pdf_file(pdf_path):
-					print(f"NOT A PDF (skipping) row {rec['row']}: {pdf_path.name}")
-					try:
-						pdf_path.unlink()
-					except Exception:
-						pass
-					continue
-	
-				rec2 = dict(rec)
-				rec2["pdf_path"] = pdf_path
-				rec2["id"] = f"abs:{idx:04d}"
-				rec2["label"] = f"lab:{idx:04d}"
-				records.append(rec2)
-	
-				print(f"OK ({src}) row {rec['row']} | area={area} | file={pdf_path.name}")
-	
-			except Exception as e:
-				print(f"ERROR row {rec['row']} area={area} url={rec.get('url','')} reason={e}")
+	for (idx, rec), (pdf_path, error) in zip(jobs, fetched):
+		if pdf_path is None:
+			if left_out is not None:
+				left_out.append({"row": rec["row"], "title": rec["title"], "error": error,
+								 "transient": error is not None and is_transient_error(error)})
+			continue
+		rec2 = dict(rec)
+		rec2["pdf_path"] = pdf_path
+		rec2["id"] = f"abs:{idx:04d}"
+		rec2["label"] = f"lab:{idx:04d}"
+		records.append(rec2)
+	return records
+
+
+def main() -> None:
+	xlsx_path = Path(XLSX_PATH)
+	out_tex = Path(OUT_TEX)
 
+	records = collect_records(load_workbook_rows(xlsx_path), executor=get_executor())
 
 	if not records:
 		raise RuntimeError("No valid PDFs downloaded for the requested AREA_ORDER list.")
 
 	build_tex(records, out_tex)
-	print(f"PDFs saved under: {pdf_dir}")
+	print(f"PDFs saved under: {PDF_DIR}")
 	print("Compile from the folder containing the .tex:")
 	print(f"  pdflatex {out_tex.name}")
 	print("If pdflatex fails due to PDF compatibility, try:")
@@ -722,6 +1122,251 @@ def main() -> None:
 
 
 
+#%% Library API
+
+@dataclass(frozen=True)
+class BookSettings:
+	"""
+	Settings of a book built through build_book(). Two builds with equal settings (and the same workbook) are
+	identical, so they are computed only once.
+	The layout of the excel file (SHEET_NAME, START_ROW, ..._COL) is read from the module variables.
+	"""
+	area_order: tuple[str, ...] = tuple(AREA_ORDER)
+	pdf_dir: Path = PDF_DIR
+	tex_dir: Path = OUT_TEX.parent		# folder containing Book-of-Abstracts_Front-part.pdf and _final-page.pdf
+	scale: float = SCALE
+
+
+class IncompleteBookError(RuntimeError):
+	"""
+	Raised by build_book() when the pdf of some abstracts could not be fetched for now (e.g. a download timed out, see
+	is_transient_error). Such a book is not cached: the next call tries to fetch the missing pdfs again.
+	- tex: content of the .tex file built without these abstracts
+	- left_out: rows left out of the book (see collect_records), including the rows left out for good
+	"""
+
+	def __init__(self, tex: bytes, left_out: list[dict]) -> None:
+		self.tex = tex
+		self.left_out = left_out
+		failed = [r for r in left_out if r["transient"]]
+		rows = ", ".join(f"{r['row']} ({r['error']})" for r in failed)
+		super().__init__(f"The pdf of {len(failed)} abstract(s) could not be fetched for now, excel rows: {rows}")
+
+
+class BookBuffer(io.BytesIO):
+	"""
+	Content of the .tex file or of the pdf returned by build_book().
+	left_out lists the rows left out of the book (see collect_records): the rows without any pdf source, and the rows
+	whose pdf has been rejected for good (not a pdf, too large, HTTP 404, ...). The book is cached with them left out.
+	"""
+
+	def __init__(self, data: bytes, left_out: list[dict]) -> None:
+		super().__init__(data)
+		self.left_out = left_out
+
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_BUILDS: OrderedDict[tuple, Future] = OrderedDict()	# build key -> Future of the result, least recently used first
+_BUILDS_LOCK = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+	"""
+	Return the worker pool shared by all builds, created the first time it is needed.
+	"""
+	global _EXECUTOR
+	with _BUILDS_LOCK:
+		if _EXECUTOR is None:
+			_EXECUTOR = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="boa")
+		return _EXECUTOR
+
+
+def clear_build_cache() -> None:
+	"""
+	Forget the workbooks, books and pdfs kept in memory by build_book().
+	"""
+	with _BUILDS_LOCK:
+		for key in [k for k, f in _BUILDS.items() if f.done()]:
+			del _BUILDS[key]
+
+
+def _evict_builds() -> None:
+	"""
+	Keep the cache bounded, forgetting the least recently used finished builds first: at most BUILD_CACHE_SIZE
+	workbooks and books (.tex), and compiled pdfs up to BUILD_CACHE_PDF_BYTES in total. Call with _BUILDS_LOCK held.
+	"""
+	done = [k for k, f in _BUILDS.items() if f.done()]
+	others = [k for k in done if k[0] != "pdf"]
+	for k in others[:max(0, len(others) - BUILD_CACHE_SIZE)]:
+		del _BUILDS[k]
+
+	# a pdf larger than the whole budget is not kept, without evicting the others for it
+	pdfs = []
+	for k in done:
+		if k[0] == "pdf":
+			if len(_BUILDS[k].result()[0]) > BUILD_CACHE_PDF_BYTES:
+				del _BUILDS[k]
+			else:
+				pdfs.append(k)
+	pdf_bytes = sum(len(_BUILDS[k].result()[0]) for k in pdfs)
+	for k in pdfs:
+		if pdf_bytes <= BUILD_CACHE_PDF_BYTES:
+			break
+		pdf_bytes -= len(_BUILDS.pop(k).result()[0])
+
+
+def _coalesced(key: tuple, build):
+	"""
+	Return build(), computing it only once for a given key: concurrent calls with the same key wait for the first one,
+	later calls get the cached result. Failed builds are not cached, the next call tries again.
+	"""
+	with _BUILDS_LOCK:
+		future = _BUILDS.get(key)
+		owner = future is None
+		if owner:
+			future = Future()
+			_BUILDS[key] = future
+		else:
+			_BUILDS.move_to_end(key)
+
+	if owner:
+		try:
+			future.set_result(build())
+		except BaseException as e:
+			with _BUILDS_LOCK:
+				del _BUILDS[key]
+			future.set_exception(e)
+		else:
+			with _BUILDS_LOCK:
+				_evict_builds()
+	return future.result()
+
+
+def _workbook_key(workbook: Path | str | bytes) -> tuple:
+	if isinstance(workbook, (bytes, bytearray)):
+		return ("bytes", hashlib.sha256(workbook).hexdigest())
+	path = Path(workbook).resolve()
+	st = path.stat()
+	return ("path", str(path), st.st_size, st.st_mtime_ns)
+
+
+def _read_workbook(workbook: Path | str | bytes) -> list[dict]:
+	if isinstance(workbook, (bytes, bytearray)):
+		return read_workbook_rows(io.BytesIO(workbook))
+	return load_workbook_rows(Path(workbook))
+
+
+def compile_tex(tex: bytes, tex_dir: Path) -> bytes:
+	"""
+	Compile the .tex content with LATEX_COMPILER in a temporary folder and return the pdf.
+	The compiler runs from tex_dir, where the front and final pages of the book are looked for.
+	"""
+	with tempfile.TemporaryDirectory() as tmp:
+		tex_path = Path(tmp) / "BookAbstract.tex"
+		tex_path.write_bytes(tex)
+		cmd = [LATEX_COMPILER, "-interaction=nonstopmode", "-halt-on-error", f"-output-directory={tmp}", str(tex_path)]
+		for _ in range(LATEX_RUNS):
+			proc = subprocess.run(cmd, cwd=tex_dir, capture_output=True, text=True, errors="replace")
+			if proc.returncode != 0:
+				raise RuntimeError(f"{LATEX_COMPILER} failed (exit code {proc.returncode}):\n{proc.stdout[-2000:]}")
+		return tex_path.with_suffix(".pdf").read_bytes()
+
+
+def build_book(workbook: Path | str | bytes, settings: BookSettings | None = None, output: str = "tex") -> BookBuffer:
+	"""
+	Build the book of abstracts in memory, e.g. on demand from a web portal.
+	The rows of each workbook, and each book and pdf are computed once and kept in memory: identical requests
+	arriving at the same time share a single build, and later ones are answered from the cache. The pdfs of the
+	abstracts are fetched by a worker pool shared by all builds.
+
+	Parameters
+	----------
+	workbook : Path | str | bytes
+		path to the excel file, or its content.
+	settings : BookSettings | None, optional
+		settings of the book. The default is None, i.e. BookSettings().
+	output : str, optional
+		"tex" for the .tex file, "pdf" for the compiled pdf. The default is "tex".
+
+	Returns
+	-------
+	BookBuffer
+		content of the .tex file (utf-8) or of the pdf, with the rows left out of the book in its left_out attribute.
+
+	Raises
+	------
+	IncompleteBookError
+		if the pdf of some abstracts could not be fetched for now (timeout, connection error, HTTP 5xx). The book is
+		not cached, and the exception holds the .tex built without them and the rows left out. Abstracts rejected for
+		good (not a pdf, too large, HTTP 4xx) do not raise: the book is built and cached without them.
+
+	"""
+	if output not in ("tex", "pdf"):
+		raise ValueError(f"output must be 'tex' or 'pdf', not {output!r}")
+	settings = settings or BookSettings()
+	wb_key = _workbook_key(workbook)
+
+	def rows() -> list[dict]:
+		return _coalesced(("rows",) + wb_key, lambda: _read_workbook(workbook))
+
+	def make() -> tuple[bytes, list[dict]]:
+		left_out: list[dict] = []
+		records = collect_records(rows(), list(settings.area_order), settings.pdf_dir, get_executor(), left_out)
+		tex = make_tex(records, settings.scale, list(settings.area_order)).encode("utf-8")
+		if any(r["transient"] for r in left_out):
+			# raising keeps this book out of the cache
+			raise IncompleteBookError(tex, left_out)
+		if not records:
+			raise RuntimeError("No valid PDFs downloaded for the requested area_order list.")
+		return tex, left_out
+
+	def tex() -> tuple[bytes, list[dict]]:
+		return _coalesced(("tex", settings) + wb_key, make)
+
+	def pdf() -> tuple[bytes, list[dict]]:
+		tex_data, left_out = tex()
+		return compile_tex(tex_data, settings.tex_dir), left_out
+
+	data, left_out = tex() if output == "tex" else _coalesced(("pdf", settings) + wb_key, pdf)
+	return BookBuffer(data, list(left_out))
+
+
+
+#%% Benchmark
+
+def benchmark_author_index(n_occurrences: int = 50_000, authors_per_record: int = 5, n_unique: int = 10_000) -> None:
+	"""
+	Time the construction of the author index and of the Author Index section on synthetic records, as well as the
+	incremental update of the index, for n_occurrences author occurrences in total.
+	"""
+	n_records = n_occurrences // authors_per_record
+	records = []
+	for i in range(n_records):
+		authors = [f"{chr(65 + (k % 26))}. {chr(65 + (k // 26) % 26)}. Surname{k:05d}"
+				for k in ((i * 7919 + j * 104729) % n_unique for j in range(authors_per_record))]
+		records.append({"id": f"abs:{i:05d}", "label": f"lab:{i:05d}", "title": f"Title {i}", "area": "Plenary",
+				"authors": authors})
+
+	t0 = time.perf_counter()
+	index = build_author_index(records)
+	t1 = time.perf_counter()
+	make_author_index_section(index)
+	t2 = time.perf_counter()
+	for ri in range(0, n_records, 10):
+		index.remove_record(ri)
+	for ri in range(0, n_records, 10):
+		index.add_record(records[ri])
+	t3 = time.perf_counter()
+
+	print(f"{n_occurrences} author occurrences, {len(index)} unique authors, {n_records} records")
+	print(f"  build_author_index          : {(t1 - t0) * 1e3:8.1f} ms")
+	print(f"  make_author_index_section   : {(t2 - t1) * 1e3:8.1f} ms")
+	print(f"  remove + re-add 10% records : {(t3 - t2) * 1e3:8.1f} ms")
+
+
 #%% Main
 if __name__ == "__main__":
-	main()
+	if "--benchmark" in sys.argv:
+		benchmark_author_index()
+	else:
+		main()